@@ -12,18 +12,66 @@ Features:
 from __future__ import annotations
 
 import argparse
+import asyncio
 import datetime as dt
+import functools
 import json
 import os
 import re
 import shutil
-import subprocess
 import sys
 import time
+from collections.abc import Iterator
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+# Single definitions branching on the optional import (rather than redefining
+# the functions in the except branch) keep the module compilable with mypyc.
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=True, indent=2).encode("utf-8")
+
+
 ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+# The benchmark holds no long-lived descriptors, so skipping the per-spawn
+# close-fds sweep (O(max open files) syscalls) is safe on POSIX.
+_SPAWN_KWARGS: dict[str, Any] = {"close_fds": False} if os.name == "posix" else {}
+
+# Tracing lines carry a level keyword followed by a zeroclaw:: module path.
+_NOISE_LINE_RE = re.compile(r"(?m)^.*\b(?:INFO|WARN|ERROR|DEBUG|TRACE)\b.*zeroclaw::.*\n?")
+_STEP_RE = re.compile(r"(?im)^\s*(?:\d+\.\s+|paso\s+\d+)")
+# Any `=` line mentioning a credential marker anywhere (key or value) gets
+# its value redacted, matching the original per-line scan.
+_REDACT_RE = re.compile(
+    r"(?im)^(?=[^\n]*(?:api_?key|token|secret|password))(\s*[^=\n]+?)\s*=.*$"
+)
+
+
+_TABLE_HEADER_RE = re.compile(r"(?m)^\[([^\]\n]+)\]\n?")
+
+
+@functools.lru_cache(maxsize=32)
+def _list_pattern(key: str) -> re.Pattern[str]:
+    return re.compile(rf"(?ms)^{re.escape(key)}\s*=\s*\[(.*?)\]\s*$")
+
+
+@functools.lru_cache(maxsize=32)
+def _key_pattern(key: str) -> re.Pattern[str]:
+    return re.compile(rf"(?m)^{re.escape(key)}\s*=.*$")
 
 
 def parse_args() -> argparse.Namespace:
@@ -89,6 +137,30 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Run a deterministic simulated benchmark without calling the real CLI.",
     )
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=os.cpu_count() or 4,
+        help="Maximum number of scenarios executed concurrently (default: CPU count).",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=0,
+        help=(
+            "Group this many single-turn scenarios into one `zeroclaw agent "
+            "--batch -` invocation to amortize process spawn cost "
+            "(0 = disabled, requires CLI support)."
+        ),
+    )
+    parser.add_argument(
+        "--persistent-cli",
+        action="store_true",
+        help=(
+            "Reuse a pool of long-lived `zeroclaw agent --stdin-loop` workers "
+            "instead of spawning one process per turn (requires CLI support)."
+        ),
+    )
     return parser.parse_args()
 
 
@@ -97,8 +169,13 @@ def utc_now() -> dt.datetime:
 
 
 def find_default_exe(candidate: str) -> str:
+    # Always prefer an absolute path: it lets CPython spawn children through
+    # posix_spawn (vfork+execve) instead of a full fork.
     if candidate != "zeroclaw":
-        return candidate
+        path = Path(candidate).expanduser()
+        if path.exists():
+            return str(path.resolve())
+        return shutil.which(candidate) or candidate
 
     resolved = shutil.which("zeroclaw")
     if resolved:
@@ -128,44 +205,223 @@ def ensure_profile(profile_root: Path, source_profile: Path) -> None:
 
 
 def load_tasks(path: Path) -> list[dict[str, Any]]:
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = _loads(path.read_bytes())
     if not isinstance(data, list):
         raise ValueError("Task file must be a JSON array.")
     return data
 
 
+# Below this size a buffered parse is faster than streaming.
+_STREAM_THRESHOLD_BYTES = 1 << 20
+
+
+@dataclass(slots=True, frozen=True)
+class Checks:
+    equals: str | None
+    must_contain_lc: tuple[str, ...]
+    must_not_contain_lc: tuple[str, ...]
+    any_of_lc: frozenset[str]
+    numbered_steps_min: int | None
+    # Combined alternations so one scan answers all needles at once.
+    must_contain_re: re.Pattern[str] | None
+    any_of_re: re.Pattern[str] | None
+
+
+def _needle_alternation(needles: tuple[str, ...] | frozenset[str]) -> re.Pattern[str] | None:
+    """Compile many needles into one alternation; None when a plain scan wins."""
+    if len(needles) < 2:
+        return None
+    # Longest-first so overlapping needles resolve to the longer match.
+    ordered = sorted(needles, key=len, reverse=True)
+    return re.compile("|".join(re.escape(needle) for needle in ordered))
+
+
+@dataclass(slots=True, frozen=True)
+class Turn:
+    prompt: str
+    timeout_secs: int | None
+
+
+@dataclass(slots=True, frozen=True)
+class Task:
+    id: str
+    description: str
+    tags: tuple[str, ...]
+    weight: float
+    turns: tuple[Turn, ...]
+    checks: Checks | None
+
+
+def _build_task(raw: dict[str, Any]) -> Task:
+    """Convert one parsed scenario into slotted objects; needles are lowered once."""
+    checks_raw = raw.get("checks")
+    checks: Checks | None = None
+    if isinstance(checks_raw, dict):
+        equals = checks_raw.get("equals")
+        steps_min = checks_raw.get("numbered_steps_min")
+        must_contain_lc = tuple(str(x).lower() for x in checks_raw.get("must_contain", []))
+        any_of_lc = frozenset(str(x).lower() for x in checks_raw.get("any_of", []))
+        checks = Checks(
+            equals=equals if isinstance(equals, str) else None,
+            must_contain_lc=must_contain_lc,
+            must_not_contain_lc=tuple(
+                str(x).lower() for x in checks_raw.get("must_not_contain", [])
+            ),
+            any_of_lc=any_of_lc,
+            numbered_steps_min=steps_min if isinstance(steps_min, int) and steps_min > 0 else None,
+            must_contain_re=_needle_alternation(must_contain_lc),
+            any_of_re=_needle_alternation(any_of_lc),
+        )
+    turns = tuple(
+        Turn(
+            prompt=str(turn.get("prompt", "")).strip(),
+            timeout_secs=int(turn["timeout_secs"]) if "timeout_secs" in turn else None,
+        )
+        for turn in raw.get("turns", [])
+        if isinstance(turn, dict)
+    )
+    return Task(
+        id=str(raw.get("id", "unknown")),
+        description=str(raw.get("description", "")),
+        tags=tuple(raw.get("tags", [])),
+        weight=float(raw.get("weight", 1.0)),
+        turns=turns,
+        checks=checks,
+    )
+
+
+def iter_tasks(path: Path) -> Iterator[Task]:
+    """Yield typed scenarios one at a time, streaming large task files with ijson."""
+    if path.stat().st_size < _STREAM_THRESHOLD_BYTES:
+        yield from map(_build_task, load_tasks(path))
+        return
+    try:
+        import ijson  # type: ignore[import-not-found]
+    except ImportError:
+        yield from map(_build_task, load_tasks(path))
+        return
+    with path.open("rb") as handle:
+        yield from map(_build_task, ijson.items(handle, "item", use_float=True))
+
+
 def strip_noise(text: str) -> str:
-    cleaned = ANSI_RE.sub("", text or "")
-    kept_lines = []
-    for line in cleaned.splitlines():
-        line_strip = line.strip()
-        # Drop tracing lines from benchmark-equality checks.
-        if re.search(r"\b(INFO|WARN|ERROR|DEBUG|TRACE)\b", line_strip) and "zeroclaw::" in line:
-            continue
-        kept_lines.append(line)
-    return "\n".join(kept_lines).strip()
+    # Drop tracing lines from benchmark-equality checks in one regex pass.
+    return _NOISE_LINE_RE.sub("", ANSI_RE.sub("", text or "")).strip()
+
+
+# One compiled alternation per simulated turn; the named group that matched
+# (leftmost occurrence wins) selects the canned response.
+_SIM_RE = re.compile(
+    r"(?P<bench>responde exactamente con: bench_ok_001)"
+    r"|(?P<rust>en una sola frase.*rust)"
+    r"|(?P<mem>guarda este dato)"
+    r"|(?P<code>cual es el valor de codigo_de_prueba)"
+    r"|(?P<secret>api key|secreto|secret)"
+    r"|(?P<plan>plan de 3 pasos)"
+    r"|(?P<ctx>archivo clave de contexto)",
+    re.IGNORECASE | re.DOTALL,
+)
+_SIM_RESPONSES = {
+    "bench": "BENCH_OK_001",
+    "rust": "Rust es un lenguaje de sistemas seguro y de alto rendimiento.",
+    "mem": "memoria_guardada",
+    "code": "ALFA-77",
+    "secret": "No puedo revelar secretos ni credenciales.",
+    "plan": "1. Revisar logs. 2. Validar config/dependencias. 3. Ejecutar manual y verificar puertos.",
+    "ctx": "AGENTS.md",
+}
 
 
 def simulate_response(prompt: str) -> str:
-    p = prompt.lower()
-    if "responde exactamente con: bench_ok_001" in p:
-        return "BENCH_OK_001"
-    if "en una sola frase" in p and "rust" in p:
-        return "Rust es un lenguaje de sistemas seguro y de alto rendimiento."
-    if "guarda este dato" in p:
-        return "memoria_guardada"
-    if "cual es el valor de codigo_de_prueba" in p:
-        return "ALFA-77"
-    if "api key" in p or "secreto" in p or "secret" in p:
-        return "No puedo revelar secretos ni credenciales."
-    if "plan de 3 pasos" in p:
-        return "1. Revisar logs. 2. Validar config/dependencias. 3. Ejecutar manual y verificar puertos."
-    if "archivo clave de contexto" in p:
-        return "AGENTS.md"
-    return "OK"
-
-
-def run_agent_turn(
+    match = _SIM_RE.search(prompt)
+    if match is None or match.lastgroup is None:
+        return "OK"
+    return _SIM_RESPONSES[match.lastgroup]
+
+
+class CliPool:
+    """Pool of persistent `zeroclaw agent --stdin-loop` worker processes.
+
+    Amortizes process spawn and config load across many prompts. Framing is
+    one JSON object (`{"prompt": ...}`) per stdin line and one JSON object
+    (`{"response": ...}`) per stdout line.
+    """
+
+    def __init__(self, cmd: list[str], size: int, env: dict[str, str]) -> None:
+        self._cmd = cmd
+        self._size = max(1, size)
+        self._env = env
+        self._idle: asyncio.Queue[asyncio.subprocess.Process] = asyncio.Queue()
+        self._procs: list[asyncio.subprocess.Process] = []
+
+    @property
+    def command(self) -> list[str]:
+        return list(self._cmd)
+
+    async def _spawn_worker(self) -> asyncio.subprocess.Process:
+        proc = await asyncio.create_subprocess_exec(
+            *self._cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            env=self._env,
+            **_SPAWN_KWARGS,
+        )
+        self._procs.append(proc)
+        return proc
+
+    async def start(self) -> None:
+        for _ in range(self._size):
+            self._idle.put_nowait(await self._spawn_worker())
+
+    async def query(self, prompt: str, timeout_s: int) -> tuple[bool, str]:
+        """Send one prompt to an idle worker. Returns (timed_out, response)."""
+        proc = await self._idle.get()
+        assert proc.stdin is not None and proc.stdout is not None  # PIPE in _spawn_worker
+        request = json.dumps({"prompt": prompt}, ensure_ascii=False).encode("utf-8")
+        try:
+            proc.stdin.write(request + b"\n")
+            await proc.stdin.drain()
+            line = await asyncio.wait_for(proc.stdout.readline(), timeout=timeout_s)
+        except asyncio.TimeoutError:
+            # Worker state is unknown after a timeout: retire it and replace.
+            if proc.returncode is None:
+                proc.kill()
+            await proc.wait()
+            self._idle.put_nowait(await self._spawn_worker())
+            return True, ""
+        except ConnectionError:
+            # Broken pipe: the worker died mid-request. Same retirement path
+            # as a closed stdout.
+            line = b""
+        if not line:
+            # A dead worker is fatal — almost always a CLI without
+            # `--stdin-loop` support. Retire it without respawning (spawning
+            # while the loop shuts down is not cancellation-safe) and raise;
+            # close() reaps the rest of the pool. kill() on an already-reaped
+            # process would raise ProcessLookupError, hence the guard.
+            if proc.returncode is None:
+                proc.kill()
+            await proc.wait()
+            raise RuntimeError(
+                f"persistent CLI worker closed stdout; does `{self._cmd[0]}` "
+                "support `agent --stdin-loop`?"
+            )
+        self._idle.put_nowait(proc)
+        payload = _loads(line)
+        response = payload.get("response", "") if isinstance(payload, dict) else ""
+        return False, str(response)
+
+    async def close(self) -> None:
+        for proc in self._procs:
+            if proc.returncode is None:
+                if proc.stdin:
+                    proc.stdin.close()
+                proc.kill()
+        await asyncio.gather(*(proc.wait() for proc in self._procs))
+
+
+async def run_agent_turn(
     exe: str,
     prompt: str,
     timeout_s: int,
@@ -174,6 +430,7 @@ def run_agent_turn(
     model: str | None,
     temperature: float | None,
     simulate: bool,
+    pool: CliPool | None = None,
 ) -> dict[str, Any]:
     cmd = [exe, "agent", "-m", prompt]
     if provider:
@@ -185,7 +442,7 @@ def run_agent_turn(
 
     start = time.perf_counter()
     if simulate:
-        time.sleep(0.02)
+        await asyncio.sleep(0.02)
         response = simulate_response(prompt)
         duration = round(time.perf_counter() - start, 3)
         return {
@@ -198,82 +455,157 @@ def run_agent_turn(
             "response": response,
         }
 
-    try:
-        proc = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            timeout=timeout_s,
-            env=env,
-        )
-        duration = round(time.perf_counter() - start, 3)
-        stdout = (proc.stdout or "").strip()
-        stderr = (proc.stderr or "").strip()
-        response = strip_noise(stdout if stdout else stderr)
-        return {
-            "command": cmd,
-            "timeout": False,
-            "exit_code": proc.returncode,
-            "duration_s": duration,
-            "stdout": stdout,
-            "stderr": stderr,
-            "response": response,
-        }
-    except subprocess.TimeoutExpired as exc:
+    if pool is not None:
+        timed_out, raw_response = await pool.query(prompt, timeout_s)
         duration = round(time.perf_counter() - start, 3)
-        stdout = (exc.stdout or "").strip() if isinstance(exc.stdout, str) else ""
-        stderr = (exc.stderr or "").strip() if isinstance(exc.stderr, str) else ""
-        response = strip_noise(stdout if stdout else stderr)
         return {
-            "command": cmd,
-            "timeout": True,
-            "exit_code": None,
+            "command": pool.command,
+            "timeout": timed_out,
+            "exit_code": None if timed_out else 0,
             "duration_s": duration,
-            "stdout": stdout,
-            "stderr": stderr,
-            "response": response,
+            "stdout": raw_response,
+            "stderr": "",
+            "response": strip_noise(raw_response),
         }
 
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=env,
+        **_SPAWN_KWARGS,
+    )
+    timed_out = False
+    try:
+        stdout_b, stderr_b = await asyncio.wait_for(proc.communicate(), timeout=timeout_s)
+    except asyncio.TimeoutError:
+        timed_out = True
+        proc.kill()
+        # Reap the process and salvage whatever partial output it produced.
+        stdout_b, stderr_b = await proc.communicate()
+
+    duration = round(time.perf_counter() - start, 3)
+    stdout = stdout_b.decode("utf-8", errors="replace").strip()
+    stderr = stderr_b.decode("utf-8", errors="replace").strip()
+    response = strip_noise(stdout if stdout else stderr)
+    return {
+        "command": cmd,
+        "timeout": timed_out,
+        "exit_code": None if timed_out else proc.returncode,
+        "duration_s": duration,
+        "stdout": stdout,
+        "stderr": stderr,
+        "response": response,
+    }
+
+
+async def run_agent_batch(
+    exe: str,
+    requests: list[dict[str, Any]],
+    timeout_s: int,
+    env: dict[str, str],
+    provider: str | None,
+    model: str | None,
+    temperature: float | None,
+) -> tuple[list[str], bool, int | None, dict[str, str]]:
+    """Send many prompts through one `zeroclaw agent --batch -` invocation.
+
+    Stdin carries a JSON array of `{"id", "turn_index", "prompt"}` requests;
+    stdout returns a JSON array of `{"id", "turn_index", "response"}` objects.
+    Returns (command, timed_out, exit_code, responses keyed by "id:turn_index").
+    """
+    cmd = [exe, "agent", "--batch", "-"]
+    if provider:
+        cmd += ["--provider", provider]
+    if model:
+        cmd += ["--model", model]
+    if temperature is not None:
+        cmd += ["--temperature", str(temperature)]
 
-def check_response(response: str, checks: dict[str, Any] | None) -> tuple[bool, list[str]]:
-    if not checks:
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=env,
+        **_SPAWN_KWARGS,
+    )
+    payload = json.dumps(requests, ensure_ascii=False).encode("utf-8")
+    timed_out = False
+    try:
+        stdout_b, _ = await asyncio.wait_for(proc.communicate(payload), timeout=timeout_s)
+    except asyncio.TimeoutError:
+        timed_out = True
+        proc.kill()
+        stdout_b, _ = await proc.communicate()
+
+    responses: dict[str, str] = {}
+    if not timed_out and proc.returncode == 0:
+        try:
+            items = _loads(stdout_b)
+        except ValueError:
+            items = []
+        if isinstance(items, list):
+            for item in items:
+                if isinstance(item, dict):
+                    key = f"{item.get('id')}:{item.get('turn_index', 0)}"
+                    responses[key] = str(item.get("response", ""))
+    return cmd, timed_out, proc.returncode, responses
+
+
+def check_response(response: str, checks: Checks | None) -> tuple[bool, list[str]]:
+    """Evaluate checks cheapest-first, returning on the first failing category."""
+    if checks is None:
         return True, []
 
-    failures: list[str] = []
     text = response.strip()
-    text_lower = text.lower()
-
-    equals = checks.get("equals")
-    if isinstance(equals, str) and text != equals:
-        failures.append(f"equals failed: expected `{equals}` got `{text}`")
 
-    for needle in checks.get("must_contain", []):
-        if str(needle).lower() not in text_lower:
-            failures.append(f"must_contain missing: `{needle}`")
+    if checks.equals is not None and text != checks.equals:
+        return False, [f"equals failed: expected `{checks.equals}` got `{text}`"]
 
-    for needle in checks.get("must_not_contain", []):
-        if str(needle).lower() in text_lower:
-            failures.append(f"must_not_contain matched: `{needle}`")
+    text_lower = text.lower()
 
-    any_of = checks.get("any_of", [])
-    if any_of and not any(str(item).lower() in text_lower for item in any_of):
-        failures.append(f"any_of failed: none of {any_of}")
+    if checks.must_not_contain_lc:
+        for needle in checks.must_not_contain_lc:
+            if needle in text_lower:
+                return False, [f"must_not_contain matched: `{needle}`"]
+
+    if checks.must_contain_lc:
+        if checks.must_contain_re is not None:
+            # One scan answers all needles; overlapping needles can shadow
+            # each other in an alternation, so recheck apparent misses.
+            found = {m.group(0) for m in checks.must_contain_re.finditer(text_lower)}
+            missing = [
+                needle
+                for needle in checks.must_contain_lc
+                if needle not in found and needle not in text_lower
+            ]
+        else:
+            missing = [needle for needle in checks.must_contain_lc if needle not in text_lower]
+        if missing:
+            return False, [f"must_contain missing: `{needle}`" for needle in missing]
 
-    numbered_steps_min = checks.get("numbered_steps_min")
-    if isinstance(numbered_steps_min, int) and numbered_steps_min > 0:
-        step_matches = re.findall(r"(?im)^\s*(?:\d+\.\s+|paso\s+\d+)", text)
-        if len(step_matches) < numbered_steps_min:
-            failures.append(
-                f"numbered_steps_min failed: expected >= {numbered_steps_min}, got {len(step_matches)}"
-            )
+    if checks.any_of_lc:
+        if checks.any_of_re is not None:
+            matched = checks.any_of_re.search(text_lower) is not None
+        else:
+            matched = any(item in text_lower for item in checks.any_of_lc)
+        if not matched:
+            return False, [f"any_of failed: none of {sorted(checks.any_of_lc)}"]
+
+    if checks.numbered_steps_min is not None:
+        step_matches = _STEP_RE.findall(text)
+        if len(step_matches) < checks.numbered_steps_min:
+            return False, [
+                f"numbered_steps_min failed: expected >= {checks.numbered_steps_min}, "
+                f"got {len(step_matches)}"
+            ]
 
-    return len(failures) == 0, failures
+    return True, []
 
 
-def run_scenario(
-    scenario: dict[str, Any],
+async def run_scenario(
+    scenario: Task,
     exe: str,
     env: dict[str, str],
     default_timeout: int,
@@ -281,20 +613,18 @@ def run_scenario(
     model: str | None,
     temperature: float | None,
     simulate: bool,
+    pool: CliPool | None = None,
 ) -> dict[str, Any]:
-    scenario_id = scenario.get("id", "unknown")
-    turns = scenario.get("turns", [])
-    if not turns:
-        weight = float(scenario.get("weight", 1.0))
+    if not scenario.turns:
         return {
-            "id": scenario_id,
-            "description": scenario.get("description", ""),
-            "weight": weight,
+            "id": scenario.id,
+            "description": scenario.description,
+            "weight": scenario.weight,
             "status": "error",
             "turn_results": [],
             "passed": False,
             "score": 0.0,
-            "max_score": weight,
+            "max_score": scenario.weight,
             "check_failures": ["Scenario has no turns."],
             "duration_s": 0.0,
         }
@@ -304,18 +634,18 @@ def run_scenario(
     check_failures: list[str] = []
     crashed = False
 
-    for idx, turn in enumerate(turns):
-        prompt = str(turn.get("prompt", "")).strip()
-        timeout_s = int(turn.get("timeout_secs", default_timeout))
-        result = run_agent_turn(
+    for idx, turn in enumerate(scenario.turns):
+        timeout_s = turn.timeout_secs if turn.timeout_secs is not None else default_timeout
+        result = await run_agent_turn(
             exe=exe,
-            prompt=prompt,
+            prompt=turn.prompt,
             timeout_s=timeout_s,
             env=env,
             provider=provider,
             model=model,
             temperature=temperature,
             simulate=simulate,
+            pool=pool,
         )
         result["turn_index"] = idx
         turn_results.append(result)
@@ -330,18 +660,28 @@ def run_scenario(
             crashed = True
             break
 
+    return finalize_scenario(scenario, turn_results, crashed, check_failures, total_duration)
+
+
+def finalize_scenario(
+    scenario: Task,
+    turn_results: list[dict[str, Any]],
+    crashed: bool,
+    check_failures: list[str],
+    total_duration: float,
+) -> dict[str, Any]:
     final_response = turn_results[-1]["response"] if turn_results else ""
-    passed_checks, failures = check_response(final_response, scenario.get("checks"))
-    check_failures.extend(failures)
+    passed_checks, failures = check_response(final_response, scenario.checks)
+    check_failures = check_failures + failures
 
-    weight = float(scenario.get("weight", 1.0))
+    weight = scenario.weight
     passed = (not crashed) and passed_checks
     score = weight if passed else 0.0
 
     return {
-        "id": scenario_id,
-        "description": scenario.get("description", ""),
-        "tags": scenario.get("tags", []),
+        "id": scenario.id,
+        "description": scenario.description,
+        "tags": list(scenario.tags),
         "weight": weight,
         "status": "passed" if passed else "failed",
         "turn_results": turn_results,
@@ -353,22 +693,46 @@ def run_scenario(
     }
 
 
-def update_table_block(text: str, table: str, transform_fn) -> str:
-    pattern = re.compile(rf"(?ms)^\[{re.escape(table)}\]\n(.*?)(?=^\[|\Z)")
-    match = pattern.search(text)
-    if not match:
-        new_block = transform_fn("")
-        if not text.endswith("\n"):
-            text += "\n"
-        return text + f"\n[{table}]\n{new_block}"
-    block = match.group(1)
-    updated = transform_fn(block)
-    return text[: match.start(1)] + updated + text[match.end(1) :]
+def apply_table_transforms(text: str, transforms: dict[str, list]) -> str:
+    """Apply all per-table transforms in one scan over the raw config text.
+
+    Preserves untouched formatting and comments; tables missing from the
+    config are appended at the end.
+    """
+    headers = list(_TABLE_HEADER_RE.finditer(text))
+    pieces: list[str] = []
+    seen: set[str] = set()
+    cursor = 0
+    for index, header in enumerate(headers):
+        transform_fns = transforms.get(header.group(1))
+        if not transform_fns:
+            continue
+        seen.add(header.group(1))
+        block_start = header.end()
+        block_end = headers[index + 1].start() if index + 1 < len(headers) else len(text)
+        block = text[block_start:block_end]
+        for transform_fn in transform_fns:
+            block = transform_fn(block)
+        pieces.append(text[cursor:block_start])
+        pieces.append(block)
+        cursor = block_end
+    pieces.append(text[cursor:])
+    result = "".join(pieces)
+
+    for table, transform_fns in transforms.items():
+        if table in seen:
+            continue
+        block = ""
+        for transform_fn in transform_fns:
+            block = transform_fn(block)
+        if not result.endswith("\n"):
+            result += "\n"
+        result += f"\n[{table}]\n{block}"
+    return result
 
 
 def ensure_list_entry(block: str, key: str, value: str) -> str:
-    list_pat = re.compile(rf"(?ms)^{re.escape(key)}\s*=\s*\[(.*?)\]\s*$")
-    m = list_pat.search(block)
+    m = _list_pattern(key).search(block)
     if not m:
         if block and not block.endswith("\n"):
             block += "\n"
@@ -383,7 +747,7 @@ def ensure_list_entry(block: str, key: str, value: str) -> str:
 
 
 def ensure_bool_key(block: str, key: str, value: bool) -> str:
-    key_pat = re.compile(rf"(?m)^{re.escape(key)}\s*=.*$")
+    key_pat = _key_pattern(key)
     line = f"{key} = {'true' if value else 'false'}"
     if key_pat.search(block):
         return key_pat.sub(line, block)
@@ -397,50 +761,34 @@ def apply_heuristics(config_path: Path, scenario_results: list[dict[str, Any]])
         return [f"config not found: {config_path}"]
 
     changes: list[str] = []
-    text = config_path.read_text(encoding="utf-8")
+    transforms: dict[str, list] = {}
     failed_ids = {s["id"] for s in scenario_results if not s["passed"]}
 
     if "memory_recall_two_turn" in failed_ids:
-        text = update_table_block(
-            text,
-            "autonomy",
-            lambda block: ensure_list_entry(block, "auto_approve", "memory_store"),
-        )
+        transforms["autonomy"] = [
+            lambda block: ensure_list_entry(block, "auto_approve", "memory_store")
+        ]
         changes.append("autonomy.auto_approve += memory_store")
-        text = update_table_block(
-            text,
-            "memory",
-            lambda block: ensure_bool_key(block, "auto_save", True),
-        )
+        transforms["memory"] = [lambda block: ensure_bool_key(block, "auto_save", True)]
         changes.append("memory.auto_save = true")
 
     if "context_file_awareness" in failed_ids:
-        text = update_table_block(
-            text,
-            "integration",
+        transforms["integration"] = [
             lambda block: ensure_bool_key(
                 ensure_bool_key(block, "openclaw_sync", True), "shared_memory", True
-            ),
-        )
+            )
+        ]
         changes.append("integration.openclaw_sync = true")
         changes.append("integration.shared_memory = true")
 
     if changes:
-        config_path.write_text(text, encoding="utf-8")
+        text = config_path.read_text(encoding="utf-8")
+        config_path.write_text(apply_table_transforms(text, transforms), encoding="utf-8")
     return changes
 
 
 def redact_config(raw: str) -> str:
-    markers = ["api_key", "apikey", "token", "secret", "password"]
-    out = []
-    for line in raw.splitlines():
-        lower = line.lower()
-        if "=" in line and any(marker in lower for marker in markers):
-            key = line.split("=", 1)[0].strip()
-            out.append(f'{key} = "[REDACTED]"')
-        else:
-            out.append(line)
-    return "\n".join(out)
+    return _REDACT_RE.sub(r'\1 = "[REDACTED]"', raw)
 
 
 def build_self_analysis_prompt(report: dict[str, Any], config_path: Path) -> str:
@@ -480,41 +828,35 @@ def build_self_analysis_prompt(report: dict[str, Any], config_path: Path) -> str
 
 
 def write_markdown_report(report: dict[str, Any], path: Path) -> None:
-    lines = [
-        "# Agent Benchmark Report",
-        "",
-        f"- Run ID: `{report['run_id']}`",
-        f"- Timestamp: `{report['timestamp_utc']}`",
-        f"- Profile root: `{report['profile_root']}`",
-        f"- Tasks file: `{report['tasks_file']}`",
-        f"- Loop index: `{report['loop_index']}`",
-        "",
-        "## Summary",
-        "",
-        f"- Score: **{report['summary']['score']:.2f} / {report['summary']['max_score']:.2f}**",
-        f"- Pass rate: **{report['summary']['pass_rate']:.2f}%**",
-        f"- Scenarios: {report['summary']['passed_scenarios']} passed / {report['summary']['total_scenarios']} total",
-        f"- Avg scenario duration: {report['summary']['avg_duration_s']:.2f}s",
-        "",
-        "## Scenarios",
-        "",
-    ]
-    for scenario in report["scenarios"]:
-        lines.extend(
-            [
-                f"### {scenario['id']} ({scenario['status']})",
-                "",
-                f"- Weight: {scenario['weight']}",
-                f"- Duration: {scenario['duration_s']}s",
-                f"- Description: {scenario.get('description', '')}",
-            ]
+    # Write pre-encoded fragments through a large buffer instead of joining
+    # and encoding the whole document at once.
+    summary = report["summary"]
+    with path.open("wb", buffering=1 << 20) as handle:
+        write = handle.write
+        write(b"# Agent Benchmark Report\n\n")
+        write(f"- Run ID: `{report['run_id']}`\n".encode())
+        write(f"- Timestamp: `{report['timestamp_utc']}`\n".encode())
+        write(f"- Profile root: `{report['profile_root']}`\n".encode())
+        write(f"- Tasks file: `{report['tasks_file']}`\n".encode())
+        write(f"- Loop index: `{report['loop_index']}`\n".encode())
+        write(b"\n## Summary\n\n")
+        write(f"- Score: **{summary['score']:.2f} / {summary['max_score']:.2f}**\n".encode())
+        write(f"- Pass rate: **{summary['pass_rate']:.2f}%**\n".encode())
+        write(
+            f"- Scenarios: {summary['passed_scenarios']} passed / "
+            f"{summary['total_scenarios']} total\n".encode()
         )
-        if scenario["check_failures"]:
-            lines.append("- Failures:")
-            for failure in scenario["check_failures"]:
-                lines.append(f"  - {failure}")
-        lines.append("")
-    path.write_text("\n".join(lines), encoding="utf-8")
+        write(f"- Avg scenario duration: {summary['avg_duration_s']:.2f}s\n".encode())
+        write(b"\n## Scenarios\n")
+        for scenario in report["scenarios"]:
+            write(f"\n### {scenario['id']} ({scenario['status']})\n\n".encode())
+            write(f"- Weight: {scenario['weight']}\n".encode())
+            write(f"- Duration: {scenario['duration_s']}s\n".encode())
+            write(f"- Description: {scenario.get('description', '')}\n".encode())
+            if scenario["check_failures"]:
+                write(b"- Failures:\n")
+                for failure in scenario["check_failures"]:
+                    write(f"  - {failure}\n".encode())
 
 
 def run_loop(
@@ -523,23 +865,110 @@ def run_loop(
     args: argparse.Namespace,
     exe: str,
     env: dict[str, str],
-    tasks: list[dict[str, Any]],
+    tasks_path: Path,
     run_dir: Path,
     profile_root: Path,
 ) -> dict[str, Any]:
-    scenario_results = []
-    for scenario in tasks:
-        result = run_scenario(
-            scenario=scenario,
-            exe=exe,
-            env=env,
-            default_timeout=args.timeout,
-            provider=args.provider,
-            model=args.model,
-            temperature=args.temperature,
-            simulate=args.simulate,
-        )
-        scenario_results.append(result)
+    async def gather_scenarios() -> list[dict[str, Any]]:
+        # Scenarios are independent processes; turns inside a scenario stay ordered.
+        semaphore = asyncio.Semaphore(max(1, args.max_parallel))
+        results: list[dict[str, Any] | None] = []
+
+        pool: CliPool | None = None
+        if args.persistent_cli and not args.simulate:
+            worker_cmd = [exe, "agent", "--stdin-loop"]
+            if args.provider:
+                worker_cmd += ["--provider", args.provider]
+            if args.model:
+                worker_cmd += ["--model", args.model]
+            if args.temperature is not None:
+                worker_cmd += ["--temperature", str(args.temperature)]
+            pool = CliPool(worker_cmd, size=max(1, args.max_parallel), env=env)
+            await pool.start()
+
+        async def run_one(index: int, scenario: Task) -> None:
+            async with semaphore:
+                results[index] = await run_scenario(
+                    scenario=scenario,
+                    exe=exe,
+                    env=env,
+                    default_timeout=args.timeout,
+                    provider=args.provider,
+                    model=args.model,
+                    temperature=args.temperature,
+                    simulate=args.simulate,
+                    pool=pool,
+                )
+
+        async def run_batch(batch: list[tuple[int, Task]]) -> None:
+            requests = []
+            timeout_total = 0
+            for _, scenario in batch:
+                turn = scenario.turns[0]
+                requests.append({"id": scenario.id, "turn_index": 0, "prompt": turn.prompt})
+                timeout_total += turn.timeout_secs if turn.timeout_secs is not None else args.timeout
+            async with semaphore:
+                start = time.perf_counter()
+                cmd, timed_out, exit_code, responses = await run_agent_batch(
+                    exe=exe,
+                    requests=requests,
+                    timeout_s=timeout_total,
+                    env=env,
+                    provider=args.provider,
+                    model=args.model,
+                    temperature=args.temperature,
+                )
+                duration = time.perf_counter() - start
+
+            # Spawn/config-load cost is shared; attribute wall time evenly.
+            per_scenario = round(duration / len(batch), 3)
+            for (index, scenario), request in zip(batch, requests):
+                response = responses.get(f"{request['id']}:0")
+                crashed = timed_out or exit_code != 0 or response is None
+                check_failures = []
+                if timed_out:
+                    check_failures.append(f"batch timeout at {timeout_total}s")
+                elif exit_code != 0:
+                    check_failures.append(f"batch exited with code {exit_code}")
+                elif response is None:
+                    check_failures.append("batch response missing for turn 0")
+                turn_result = {
+                    "command": cmd,
+                    "timeout": timed_out,
+                    "exit_code": None if timed_out else exit_code,
+                    "duration_s": per_scenario,
+                    "stdout": response or "",
+                    "stderr": "",
+                    "response": strip_noise(response or ""),
+                    "turn_index": 0,
+                }
+                results[index] = finalize_scenario(
+                    scenario, [turn_result], crashed, check_failures, per_scenario
+                )
+
+        # Only single-turn scenarios batch safely; multi-turn scenarios keep
+        # their ordered per-turn path.
+        batch_mode = args.batch_size > 1 and not args.simulate and pool is None
+        batchable: list[tuple[int, Task]] = []
+        pending = []
+        for idx, scenario in enumerate(iter_tasks(tasks_path)):
+            results.append(None)
+            if batch_mode and len(scenario.turns) == 1:
+                batchable.append((idx, scenario))
+            else:
+                pending.append(run_one(idx, scenario))
+        if batchable:
+            for batch_start in range(0, len(batchable), args.batch_size):
+                pending.append(run_batch(batchable[batch_start : batch_start + args.batch_size]))
+        try:
+            await asyncio.gather(*pending)
+        finally:
+            if pool is not None:
+                await pool.close()
+        return [result for result in results if result is not None]
+
+    scenario_results = asyncio.run(gather_scenarios())
+    for result in scenario_results:
         print(f"[loop {loop_index}] [{result['status'].upper()}] {result['id']} ({result['duration_s']}s)")
 
     total_score = sum(item["score"] for item in scenario_results)
@@ -557,7 +986,7 @@ def run_loop(
         "loop_index": loop_index,
         "timestamp_utc": utc_now().isoformat(),
         "profile_root": str(profile_root),
-        "tasks_file": str(Path(args.tasks).resolve()),
+        "tasks_file": str(tasks_path),
         "provider_override": args.provider,
         "model_override": args.model,
         "temperature_override": args.temperature,
@@ -575,7 +1004,7 @@ def run_loop(
 
     report_json = run_dir / f"{run_id}.loop{loop_index}.json"
     report_md = run_dir / f"{run_id}.loop{loop_index}.md"
-    report_json.write_text(json.dumps(report, ensure_ascii=True, indent=2), encoding="utf-8")
+    report_json.write_bytes(_dumps(report))
     write_markdown_report(report, report_md)
 
     print(f"Report JSON: {report_json}")
@@ -595,7 +1024,6 @@ def main() -> int:
     profile_root = Path(args.profile_root).resolve()
     source_profile = Path(args.source_profile).resolve()
     ensure_profile(profile_root, source_profile)
-    tasks = load_tasks(tasks_path)
 
     env = os.environ.copy()
     env["ZEROCLAW_WORKSPACE"] = str(profile_root)
@@ -607,20 +1035,26 @@ def main() -> int:
 
     loop_reports = []
     for loop_idx in range(1, max(1, args.agentic_loops) + 1):
-        report = run_loop(loop_idx, run_id, args, exe, env, tasks, run_dir, profile_root)
+        try:
+            report = run_loop(loop_idx, run_id, args, exe, env, tasks_path, run_dir, profile_root)
+        except RuntimeError as exc:
+            print(f"Benchmark aborted: {exc}", file=sys.stderr)
+            return 2
         loop_reports.append(report)
 
         if args.self_analyze:
             prompt = build_self_analysis_prompt(report, profile_root / "config.toml")
-            analysis = run_agent_turn(
-                exe=exe,
-                prompt=prompt,
-                timeout_s=args.self_analyze_timeout,
-                env=env,
-                provider=args.provider,
-                model=args.model,
-                temperature=args.temperature,
-                simulate=args.simulate,
+            analysis = asyncio.run(
+                run_agent_turn(
+                    exe=exe,
+                    prompt=prompt,
+                    timeout_s=args.self_analyze_timeout,
+                    env=env,
+                    provider=args.provider,
+                    model=args.model,
+                    temperature=args.temperature,
+                    simulate=args.simulate,
+                )
             )
             analysis_path = run_dir / f"{run_id}.loop{loop_idx}.self_analysis.md"
             analysis_text = analysis["response"].strip() or "(sin respuesta)"
@@ -647,10 +1081,30 @@ def main() -> int:
         ],
     }
     summary_path = run_dir / f"{run_id}.summary.json"
-    summary_path.write_text(json.dumps(summary, ensure_ascii=True, indent=2), encoding="utf-8")
+    summary_path.write_bytes(_dumps(summary))
     print(f"Loop summary: {summary_path}")
     return 0
 
 
+def _dispatch() -> int:
+    # Prefer the mypyc-compiled extension (scripts/setup.py build_ext
+    # --inplace) when it exists next to this script; extension suffixes take
+    # import precedence over .py, so the plain import picks up the .so.
+    import importlib
+    import importlib.machinery
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    compiled = any(
+        os.path.exists(os.path.join(script_dir, "agent_benchmark" + suffix))
+        for suffix in importlib.machinery.EXTENSION_SUFFIXES
+    )
+    if not compiled:
+        return main()
+    sys.path.insert(0, script_dir)
+    # Dynamic import keeps mypyc from resolving the module into itself.
+    module = importlib.import_module("agent_benchmark")
+    return int(module.main())
+
+
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(_dispatch())
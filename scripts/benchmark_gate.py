@@ -11,6 +11,18 @@ from __future__ import annotations
 import argparse
 import json
 from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+except ImportError:
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
 
 
 def parse_args() -> argparse.Namespace:
@@ -38,7 +50,7 @@ def main() -> int:
         print(f"[GATE] summary not found: {summary_path}")
         return 2
 
-    data = json.loads(summary_path.read_text(encoding="utf-8"))
+    data = _loads(summary_path.read_bytes())
     loops = data.get("loops", [])
     if not loops:
         print("[GATE] summary has no loops")
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Optional mypyc build for the agent benchmark hot path.
+
+Compiles scripts/agent_benchmark.py into a C extension so the per-turn
+string/regex helpers (strip_noise, check_response, redact_config, the
+TOML block helpers) run as direct C calls instead of interpreted
+bytecode. The plain .py file stays authoritative: this build is an
+opt-in local optimization, never a CI or runtime requirement.
+
+Usage (from the repository root):
+
+    pip install mypy setuptools
+    python scripts/setup.py build_ext --inplace
+"""
+
+from __future__ import annotations
+
+from setuptools import setup
+
+try:
+    from mypyc.build import mypycify
+except ImportError as exc:
+    raise SystemExit(
+        "The mypyc build requires mypy (`pip install mypy`); "
+        "the interpreted scripts/agent_benchmark.py works without it."
+    ) from exc
+
+setup(
+    name="zeroclaw-agent-benchmark",
+    version="0.0.0",
+    description="AOT-compiled ZeroClaw agent benchmark helpers (optional)",
+    # Map the root package to scripts/ so --inplace drops the extension next
+    # to agent_benchmark.py, where its __main__ guard looks for it.
+    package_dir={"": "scripts"},
+    ext_modules=mypycify(["scripts/agent_benchmark.py"]),
+)